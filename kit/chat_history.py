@@ -6,27 +6,202 @@ Es ermöglicht das automatische Speichern und Wiederherstellen von Konversatione
 für die Modi: normalchat, websearch und codex.
 
 Funktionalität:
-- Automatisches Speichern beim Beenden
+- Automatisches Speichern im Hintergrund (während des Chats und beim Beenden)
 - Fortsetzen vorheriger Chats mit interaktivem Menü
 - Modusspezifische Trennung (jeder Modus hat eigene Chat-Files)
 - Permanente Speicherung ohne automatisches Löschen
 
 Speicherort: ~/.config/KIterminal/chats/
-Dateiformat: {mode}_{timestamp}.json
+Dateiformat:
+- {mode}_{timestamp}.jsonl      — Historie, eine Nachricht pro Zeile (NDJSON)
+- {mode}_{timestamp}.meta.json  — Metadaten für die Chat-Übersicht
+- {mode}_{timestamp}.json       — altes Format, wird beim nächsten Speichern migriert
 """
 
 import json
+import mmap
+import os
+import queue
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from rich.console import Console
-from rich.prompt import Prompt
-from kit.config import loadconfig
+from kit.config import loadconfig, config_file
+
+try:
+    import orjson
+except ImportError:  # Optional: Fallback auf die Standard-Library
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # Optional: ohne ijson wird die ganze Datei geparst
+    ijson = None
+
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    def _dumps_line(obj):
+        # Newline direkt von orjson, ohne zweite bytes-Kopie durch "+"
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+else:
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+    def _dumps_line(obj):
+        return (json.dumps(obj, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+# Ab dieser Grösse werden Chat-Dateien per mmap an orjson übergeben;
+# bei kleineren Dateien überwiegt der mmap-Overhead
+_MMAP_THRESHOLD = 4096
+
+# Fehler, bei denen eine Chat-Datei in der Übersicht übersprungen wird
+_PARSE_ERRORS = (json.JSONDecodeError, KeyError)
+if ijson is not None:
+    _PARSE_ERRORS += (ijson.JSONError,)
+
+# Endungen der Historie (NDJSON) und der zugehörigen Metadaten-Datei
+_HISTORY_SUFFIX = ".jsonl"
+_META_SUFFIX = ".meta.json"
+
+# Alte .json-Dateien: die erste User-Nachricht steht praktisch immer
+# in den ersten Kilobytes und wird per Regex statt per Parser gefunden
+_HEAD_SCAN_BYTES = 8192
+
+# Threads für das parallele Lesen der Chat-Dateien in list_saved_chats()
+_LIST_WORKERS = 8
+
+# Maximale Anzahl Chats im Auswahlmenü (neueste zuerst)
+_MENU_LIMIT = 50
+
+# Dateinamen: {mode}_{YYYY-MM-DD_HH-MM-SS}.jsonl (bzw. .json im alten Format)
+_FILENAME_RE = re.compile(
+    r"^(?P<mode>\w+?)_(?P<timestamp>\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2})\.jsonl?$"
+)
+
+# Regex-Scan des Dateianfangs alter Chat-Dateien (siehe _scan_chat_head)
+_MODE_RE = re.compile(rb'"mode"\s*:\s*"([^"\\]*)"')
+_TIMESTAMP_FIELD_RE = re.compile(rb'"timestamp"\s*:\s*"([^"\\]*)"')
+_PREVIEW_RE = re.compile(
+    rb'"role"\s*:\s*"user"\s*,\s*"content"\s*:\s*"((?:[^"\\]|\\.){0,1024})(")?'
+)
+_PARTIAL_ESCAPE_RE = re.compile(r"\\u[0-9a-fA-F]{0,3}$")
+
 # Globale Variable: Trackt den aktuell geladenen Chat-File
 # Wird gesetzt wenn ein Chat fortgesetzt wird, sonst None
 current_chat_file = None
 
-# Console-Instanz für Rich-Ausgaben
-console = Console()
+# Aufgelöstes Chat-Verzeichnis + mtime der config.json, aus der es stammt
+_chat_dir_cache = None
+_chat_dir_config_mtime = 0
+
+# Console-Instanz für Rich-Ausgaben — erst bei Bedarf erstellt, damit
+# save_chat/load_chat/list_saved_chats Rich gar nicht importieren
+_console = None
+
+# Hintergrund-Speichern: Queue + Worker-Thread, erst beim ersten Auftrag gestartet
+_save_queue = None
+_save_lock = threading.Lock()
+
+def _make_preview(text):
+    """
+    Erstellt eine einzeilige Vorschau (max 60 Zeichen) einer Nachricht.
+
+    Zeilenumbrüche und mehrfache Leerzeichen werden entfernt —
+    wichtig für piped input, das oft mehrzeilig ist.
+    """
+    preview_clean = " ".join(text.split())
+    return preview_clean[:60] + "..." if len(preview_clean) > 60 else preview_clean
+
+
+def _format_timestamp(timestamp):
+    """
+    Formatiert einen Timestamp für die Anzeige.
+
+    Format: YYYY-MM-DD_HH-MM-SS → YYYY:MM:DD HH:MM:SS
+    """
+    timestamp_parts = timestamp.split("_")  # Split date and time
+    if len(timestamp_parts) == 2:
+        date_part = timestamp_parts[0].replace("-", ":")  # 2025-11-24 → 2025:11:24
+        time_part = timestamp_parts[1].replace("-", ":")  # 14-06-38 → 14:06:38
+        return f"{date_part} {time_part}"
+    # Fallback for unexpected format
+    return timestamp
+
+
+def _first_user_message(history):
+    """
+    Gibt den Inhalt der ersten User-Nachricht zurück (oder "").
+
+    Die erste User-Nachricht ist fast immer history[0] oder history[1],
+    deshalb werden diese zuerst geprüft, bevor die ganze Historie durchsucht wird.
+    """
+    for m in history[:2]:
+        if m.get("role") == "user":
+            return m["content"]
+    return next((m["content"] for m in history[2:] if m["role"] == "user"), "")
+
+
+def _read_json(path):
+    """
+    Liest und parst eine JSON-Datei.
+
+    Grosse Dateien werden mit orjson direkt aus einem mmap geparst —
+    ohne Zwischenkopie als bytes und ohne Dekodierung zu str.
+    """
+    with open(path, 'rb') as f:
+        if orjson is None or os.fstat(f.fileno()).st_size < _MMAP_THRESHOLD:
+            return _loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
+
+
+def _get_console():
+    """Gibt die Rich-Console zurück und erstellt sie beim ersten Aufruf."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+
+def _write_atomic(path, data):
+    """
+    Schreibt bytes atomar: erst in eine .tmp-Datei, dann os.replace().
+
+    Leser (z.B. list_saved_chats) sehen nie eine halb geschriebene Datei.
+    Gepuffertes write() schreibt alles oder wirft (z.B. bei vollem Datenträger);
+    dann bleibt die alte Datei unverändert und die .tmp-Datei wird entfernt.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _meta_path(history_path):
+    """Pfad der Metadaten-Datei zu einer Historie ({name}.jsonl → {name}.meta.json)."""
+    return history_path.with_suffix(_META_SUFFIX)
+
+
+def _read_meta(meta_path):
+    """Liest eine Metadaten-Datei, oder None falls sie fehlt/ungültig ist."""
+    try:
+        return _read_json(meta_path)
+    except (OSError, json.JSONDecodeError):
+        return None
+
 
 def get_chat_dir():
     """
@@ -35,9 +210,18 @@ def get_chat_dir():
     Verwendet den benutzerdefinierten Pfad aus der Config falls gesetzt,
     andernfalls den Standard-Pfad ~/.config/KIterminal/chats/
 
+    Der Pfad wird gecacht, bis sich config.json ändert — danach kostet
+    ein Aufruf nur noch einen stat() statt Config-Laden + mkdir.
+
     Returns:
         Path: Pfad zum Chat-Verzeichnis
     """
+    global _chat_dir_cache, _chat_dir_config_mtime
+
+    config_mtime = config_file.stat().st_mtime_ns
+    if _chat_dir_cache is not None and config_mtime == _chat_dir_config_mtime:
+        return _chat_dir_cache
+
     config = loadconfig()
     custom_path = config.get("Chatpath", "")
     
@@ -48,81 +232,200 @@ def get_chat_dir():
         chat_dir = Path.home() / ".config" / "KIterminal" / "KITchats"
     
     chat_dir.mkdir(parents=True, exist_ok=True)
+    _chat_dir_cache = chat_dir
+    _chat_dir_config_mtime = config_mtime
     return chat_dir
 
 
 def save_chat(chat_history, mode, filepath=None):
     """
-    Speichert die Chat-Historie in einer JSON-Datei.
+    Speichert die Chat-Historie als NDJSON-Datei plus Metadaten-Datei.
 
     Verhaltensweise:
     - Wenn filepath übergeben wird (Chat wird fortgesetzt):
-      → Überschreibt die bestehende Datei mit dem gleichen Timestamp
+      → Hängt nur die neuen Nachrichten an die bestehende Datei an
     - Wenn filepath=None (neuer Chat):
       → Erstellt eine neue Datei mit aktuellem Timestamp
 
+    Welche Nachrichten bereits gespeichert sind, steht in der Metadaten-Datei
+    (message_count + history_bytes). Sie wird erst nach dem Anhängen
+    aktualisiert; Bytes hinter history_bytes (z.B. nach einem Absturz) werden
+    beim nächsten Speichern verworfen. Ist die Historie kürzer als gespeichert,
+    wird die Datei komplett neu geschrieben.
+
+    Alte .json-Dateien werden beim Fortsetzen ins neue Format migriert
+    und danach gelöscht.
+
     Args:
         chat_history (list): Liste von Nachrichten [{"role": "user/assistant", "content": "..."}]
         mode (str): Chat-Modus (normalchat, websearch, codex)
         filepath (Path, optional): Pfad zum bestehenden Chat-File. Defaults to None.
 
     Returns:
-        Path: Pfad zur gespeicherten Datei, oder None wenn chat_history leer ist
-
-    Beispiel JSON-Struktur:
-        {
-            "mode": "normalchat",
-            "timestamp": "2025-11-16_14-30-15",
-            "history": [
-                {"role": "user", "content": "Hallo"},
-                {"role": "assistant", "content": "Hallo! Wie kann ich helfen?"}
-            ]
-        }
+        Path: Pfad zur gespeicherten .jsonl-Datei, oder None wenn chat_history leer ist
+
+    Beispiel:
+        normalchat_2025-11-16_14-30-15.jsonl:
+            {"role":"user","content":"Hallo"}
+            {"role":"assistant","content":"Hallo! Wie kann ich helfen?"}
+
+        normalchat_2025-11-16_14-30-15.meta.json:
+            {
+              "mode": "normalchat",
+              "timestamp": "2025-11-16_14-30-15",
+              "message_count": 2,
+              "preview": "Hallo",
+              "history_bytes": 96
+            }
     """
     # Leere Chat-Historie wird nicht gespeichert
     if not chat_history:
         return None
 
     chat_dir = get_chat_dir()
+    legacy_file = None
+    meta = None
 
     # Fall 1: Bestehenden Chat fortsetzen
     if filepath:
         filepath = Path(filepath)
-        # Versuche den ursprünglichen Timestamp aus der Datei zu lesen
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                existing_data = json.load(f)
+        if filepath.suffix != _HISTORY_SUFFIX:
+            # Altes Format: wird unter gleichem Namen als .jsonl neu geschrieben
+            legacy_file = filepath
+            filepath = filepath.with_suffix(_HISTORY_SUFFIX)
+        else:
+            meta = _read_meta(_meta_path(filepath))
+
+        # Der originale Timestamp steckt bereits im Dateinamen — kein Lesen nötig
+        name_match = _FILENAME_RE.match(filepath.name)
+        if name_match:
+            timestamp = name_match["timestamp"]
+        elif meta is not None and "timestamp" in meta:
+            timestamp = meta["timestamp"]
+        else:
+            # Unbekannter Dateiname: Versuche den Timestamp aus der alten Datei zu lesen
+            try:
+                existing_data = _read_json(legacy_file) if legacy_file else {}
                 # Behalte den originalen Timestamp bei
                 timestamp = existing_data.get("timestamp", datetime.now().strftime("%Y-%m-%d_%H-%M-%S"))
-        except:
-            # Fallback: Falls die Datei nicht lesbar ist, nutze aktuellen Timestamp
-            timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+            except Exception:
+                # Fallback: Falls die Datei nicht lesbar ist, nutze aktuellen Timestamp
+                timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
 
     # Fall 2: Neuen Chat erstellen
     else:
         # Erstelle Timestamp im Format: YYYY-MM-DD_HH-MM-SS
         timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        # Dateiname: {mode}_{timestamp}.json (z.B. normalchat_2025-11-16_14-30-15.json)
-        filename = f"{mode}_{timestamp}.json"
+        # Dateiname: {mode}_{timestamp}.jsonl (z.B. normalchat_2025-11-16_14-30-15.jsonl)
+        filename = f"{mode}_{timestamp}{_HISTORY_SUFFIX}"
         filepath = chat_dir / filename
 
-    # Erstelle die JSON-Struktur
-    chat_data = {
+    saved_count = meta.get("message_count", 0) if meta else 0
+    saved_bytes = meta.get("history_bytes", 0) if meta else 0
+
+    if 0 < saved_count <= len(chat_history) and filepath.exists():
+        # Nur neue Nachrichten anhängen, alles hinter dem letzten Stand verwerfen
+        new_data = b"".join(_dumps_line(m) for m in chat_history[saved_count:])
+        with open(filepath, 'r+b') as f:
+            f.truncate(saved_bytes)
+            f.seek(saved_bytes)
+            f.write(new_data)
+        history_bytes = saved_bytes + len(new_data)
+        preview = meta.get("preview")
+    else:
+        # Neuer Chat, Migration oder abweichende Historie: komplett neu schreiben
+        data = b"".join(_dumps_line(m) for m in chat_history)
+        _write_atomic(filepath, data)
+        history_bytes = len(data)
+        preview = None
+
+    if preview is None:
+        preview = _make_preview(_first_user_message(chat_history))
+
+    _write_atomic(_meta_path(filepath), _dumps({
         "mode": mode,
         "timestamp": timestamp,
-        "history": chat_history
-    }
+        "message_count": len(chat_history),
+        "preview": preview,
+        "history_bytes": history_bytes,
+    }))
 
-    # Speichere in Datei mit UTF-8 Encoding (wichtig für Umlaute/Emojis)
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(chat_data, f, ensure_ascii=False, indent=2)
+    if legacy_file is not None:
+        legacy_file.unlink(missing_ok=True)
 
     return filepath
 
 
+def _save_worker():
+    """
+    Arbeitet die Speicheraufträge der Reihe nach ab.
+
+    Der Worker führt current_chat_file selbst nach: der erste Auftrag eines
+    neuen Chats legt die Datei an, alle weiteren hängen an dieselbe Datei an.
+    """
+    global current_chat_file
+    while True:
+        job = _save_queue.get()
+        try:
+            if isinstance(job, threading.Event):
+                # Markierung von flush_saves(): alles davor ist geschrieben
+                job.set()
+                continue
+            history, mode = job
+            current_chat_file = save_chat(history, mode, filepath=current_chat_file)
+        except Exception as e:
+            _get_console().print(f"[red]✗ Fehler beim Speichern: {e}[/red]")
+        finally:
+            _save_queue.task_done()
+
+
+def _get_save_queue():
+    """Gibt die Speicher-Queue zurück und startet beim ersten Aufruf den Worker."""
+    global _save_queue
+    with _save_lock:
+        if _save_queue is None:
+            _save_queue = queue.Queue()
+            threading.Thread(target=_save_worker, name="kit-save", daemon=True).start()
+    return _save_queue
+
+
+def save_chat_async(chat_history, mode):
+    """
+    Speichert die Chat-Historie im Hintergrund (siehe save_chat).
+
+    Gespeichert wird eine Momentaufnahme der Liste, sodass der Chat sofort
+    weiterlaufen kann. Ziel ist current_chat_file; der Worker setzt es nach
+    dem Speichern auf die geschriebene Datei.
+
+    Args:
+        chat_history (list): Liste von Nachrichten
+        mode (str): Chat-Modus
+    """
+    if not chat_history:
+        return
+    _get_save_queue().put((list(chat_history), mode))
+
+
+def flush_saves(timeout=None):
+    """
+    Wartet, bis alle bisher eingereihten Speicheraufträge erledigt sind.
+
+    Args:
+        timeout (float, optional): Maximale Wartezeit in Sekunden
+
+    Returns:
+        bool: True wenn alles geschrieben ist, False bei Timeout
+    """
+    if _save_queue is None:
+        return True
+    done = threading.Event()
+    _save_queue.put(done)
+    return done.wait(timeout)
+
+
 def load_chat(filepath):
     """
-    Lädt einen gespeicherten Chat aus einer JSON-Datei.
+    Lädt einen gespeicherten Chat (NDJSON oder altes JSON-Format).
 
     Args:
         filepath (str/Path): Pfad zur Chat-Datei
@@ -134,18 +437,165 @@ def load_chat(filepath):
         FileNotFoundError: Wenn die Datei nicht existiert
         json.JSONDecodeError: Wenn die JSON-Struktur ungültig ist
     """
-    with open(filepath, 'r', encoding='utf-8') as f:
-        chat_data = json.load(f)
-    return chat_data["history"]
+    filepath = Path(filepath)
+    if filepath.suffix != _HISTORY_SUFFIX:
+        chat_data = _read_json(filepath)
+        return chat_data["history"]
+
+    # Nur bis zum zuletzt vollständig gespeicherten Stand lesen
+    meta = _read_meta(_meta_path(filepath))
+    with open(filepath, 'rb') as f:
+        data = f.read(meta["history_bytes"]) if meta and "history_bytes" in meta else f.read()
+    return [_loads(line) for line in data.split(b"\n") if line.strip()]
+
+
+def _scan_chat_head(path):
+    """
+    Ermittelt die Übersichts-Infos alter Chat-Dateien ohne JSON-Parser.
+
+    mode und timestamp stammen aus dem Dateinamen (bzw. per Regex aus den
+    ersten 8 KB), die erste User-Nachricht wird per Regex aus den ersten 8 KB
+    gelesen, die Anzahl Nachrichten über die "role"-Keys gezählt.
+    In JSON-Strings sind Anführungszeichen escaped, daher kann Text in den
+    Nachrichten die Keys nicht vortäuschen.
+
+    Returns:
+        tuple or None: (mode, timestamp, erste User-Nachricht (gekürzt), Anzahl
+                       Nachrichten) — oder None, falls etwas nicht gefunden wurde
+    """
+    with open(path, 'rb') as f:
+        data = f.read(_HEAD_SCAN_BYTES)
+
+        preview_match = _PREVIEW_RE.search(data)
+        if not preview_match:
+            return None
+
+        name_match = _FILENAME_RE.match(os.path.basename(path))
+        if name_match:
+            chat_mode, timestamp = name_match["mode"], name_match["timestamp"]
+        else:
+            mode_match = _MODE_RE.search(data)
+            ts_match = _TIMESTAMP_FIELD_RE.search(data)
+            if not (mode_match and ts_match):
+                return None
+            chat_mode = mode_match.group(1).decode("utf-8")
+            timestamp = ts_match.group(1).decode("utf-8")
+
+        data += f.read()
+
+    # Abgeschnittene UTF-8- und \uXXXX-Sequenzen verwerfen, JSON-Escapes auflösen
+    raw = preview_match.group(1).decode("utf-8", errors="ignore")
+    truncated = preview_match.group(2) is None
+    if truncated:
+        raw = _PARTIAL_ESCAPE_RE.sub("", raw)
+    try:
+        first_user_msg = json.loads(f'"{raw}"')
+    except json.JSONDecodeError:
+        return None
+
+    # Zu kurz für eine vollständige Vorschau → lieber richtig parsen
+    if truncated and len(" ".join(first_user_msg.split())) <= 60:
+        return None
+
+    return chat_mode, timestamp, first_user_msg, data.count(b'"role"')
+
+
+def _scan_chat_file(path):
+    """
+    Liest die Übersichts-Infos einer Chat-Datei, ohne die Historie aufzubauen.
+
+    Mit ijson wird die Datei gestreamt: es werden nur Events gezählt und die
+    erste User-Nachricht gemerkt, statt hunderte Message-Dicts zu erzeugen.
+    Ohne ijson wird die Datei vollständig geparst.
+
+    Args:
+        path (str/Path): Pfad zur Chat-Datei
+
+    Returns:
+        tuple: (mode, timestamp, erste User-Nachricht, Anzahl Nachrichten)
+
+    Raises:
+        KeyError: Wenn mode, timestamp oder history fehlen
+    """
+    if ijson is None:
+        chat_data = _read_json(path)
+        history = chat_data["history"]
+        return chat_data["mode"], chat_data["timestamp"], _first_user_message(history), len(history)
+
+    mode = timestamp = first_user_msg = None
+    has_history = False
+    message_count = 0
+    role = None
+    with open(path, 'rb') as f:
+        for prefix, event, value in ijson.parse(f):
+            if prefix == "history.item":
+                if event == "start_map":
+                    message_count += 1
+                    role = None
+            elif prefix == "history.item.role":
+                role = value
+            elif prefix == "history.item.content":
+                if first_user_msg is None and role == "user":
+                    first_user_msg = value
+            elif prefix == "history" and event == "start_array":
+                has_history = True
+            elif prefix == "mode":
+                mode = value
+            elif prefix == "timestamp":
+                timestamp = value
+
+    if mode is None or timestamp is None or not has_history:
+        raise KeyError(f"Unvollständige Chat-Datei: {path}")
+    return mode, timestamp, first_user_msg or "", message_count
+
+
+def _extract_chat_meta(entry):
+    """
+    Liest die Übersichts-Infos einer Chat-Datei für list_saved_chats().
+
+    Args:
+        entry (os.DirEntry): Verzeichniseintrag der Chat-Datei
+
+    Returns:
+        dict or None: Chat-Info, oder None bei fehlerhaften/unvollständigen Dateien
+    """
+    filepath = Path(entry.path)
+    try:
+        if entry.name.endswith(_META_SUFFIX):
+            # NDJSON-Format: alles steht in der kleinen Metadaten-Datei
+            meta = _read_json(entry.path)
+            filepath = filepath.with_name(entry.name[:-len(_META_SUFFIX)] + _HISTORY_SUFFIX)
+            chat_mode = meta["mode"]
+            timestamp = meta["timestamp"]
+            preview = meta["preview"]
+            message_count = meta["message_count"]
+        else:
+            # Altes Format: Regex-Scan, notfalls Vorschau + Anzahl aus der Historie
+            info = _scan_chat_head(entry.path) or _scan_chat_file(entry.path)
+            chat_mode, timestamp, first_user_msg, message_count = info
+            preview = _make_preview(first_user_msg)
+    except _PARSE_ERRORS:
+        return None
+
+    return {
+        "filepath": filepath,
+        "mode": chat_mode,
+        "timestamp": timestamp,
+        "timestamp_display": _format_timestamp(timestamp),
+        "preview": preview,
+        "message_count": message_count
+    }
 
 
-def list_saved_chats(mode=None):
+def list_saved_chats(mode=None, limit=None):
     """
     Listet alle gespeicherten Chats auf, optional gefiltert nach Modus.
 
     Args:
         mode (str, optional): Filter für spezifischen Modus (normalchat, websearch, codex).
                              Wenn None, werden alle Chats aufgelistet.
+        limit (int, optional): Maximale Anzahl Chats. Es werden nur so viele
+                               Dateien geöffnet wie nötig. None = alle.
 
     Returns:
         list: Liste von Chat-Informationen, sortiert nach Änderungsdatum (neueste zuerst)
@@ -153,6 +603,7 @@ def list_saved_chats(mode=None):
               - filepath: Pfad zur Chat-Datei
               - mode: Chat-Modus
               - timestamp: Original-Timestamp
+              - timestamp_display: Timestamp für die Anzeige (YYYY:MM:DD HH:MM:SS)
               - preview: Vorschau der ersten User-Nachricht (max 60 Zeichen)
               - message_count: Anzahl der Nachrichten im Chat
 
@@ -162,57 +613,47 @@ def list_saved_chats(mode=None):
                 "filepath": Path("~/.config/KIterminal/chats/normalchat_2025-11-16_14-30-15.json"),
                 "mode": "normalchat",
                 "timestamp": "2025-11-16_14-30-15",
+                "timestamp_display": "2025:11:16 14:30:15",
                 "preview": "Hallo wie gehts?",
                 "message_count": 8
             },
             ...
         ]
     """
-    chat_dir = get_chat_dir()
+    return list(islice(_iter_saved_chats(mode), limit))
 
-    # Glob-Pattern: Suche nach "{mode}_*.json" oder allen "*.json" wenn kein Modus angegeben
-    pattern = f"{mode}_*.json" if mode else "*.json"
 
-    # Finde alle passenden Dateien, sortiert nach Änderungsdatum (neueste zuerst)
-    chat_files = sorted(
-        chat_dir.glob(pattern),
-        key=lambda p: p.stat().st_mtime,  # Sortierung nach Modifikationszeit
-        reverse=True  # Neueste zuerst
-    )
+def _iter_saved_chats(mode):
+    """
+    Liefert die Chat-Infos für list_saved_chats() einzeln, neueste zuerst.
 
-    chats = []
-    for filepath in chat_files:
-        try:
-            # Lade die Chat-Datei
-            with open(filepath, 'r', encoding='utf-8') as f:
-                chat_data = json.load(f)
-
-                # Extrahiere die erste User-Nachricht für die Vorschau
-                first_user_msg = next(
-                    (m["content"] for m in chat_data["history"] if m["role"] == "user"),
-                    ""  # Fallback: Leerer String falls keine User-Nachricht gefunden
-                )
-
-                # Entferne Zeilenumbrüche und mehrfache Leerzeichen für einzeilige Vorschau
-                # Dies ist wichtig für piped input, das oft mehrzeilig ist
-                preview_clean = " ".join(first_user_msg.split())
-                
-                # Kürze die Vorschau auf 60 Zeichen
-                preview = preview_clean[:60] + "..." if len(preview_clean) > 60 else preview_clean
-
-                # Füge Chat-Info zur Liste hinzu
-                chats.append({
-                    "filepath": filepath,
-                    "mode": chat_data["mode"],
-                    "timestamp": chat_data["timestamp"],
-                    "preview": preview,
-                    "message_count": len(chat_data["history"])
-                })
-        except (json.JSONDecodeError, KeyError):
-            # Überspringe fehlerhafte/unvollständige Dateien
-            continue
+    Die Dateien werden in Blöcken von _LIST_WORKERS parallel gelesen, sodass
+    bei vorzeitigem Abbruch (limit) nur wenige Dateien zu viel geöffnet werden.
+    """
+    chat_dir = get_chat_dir()
+
+    # Ein einziger scandir-Durchlauf statt glob + stat() pro Datei:
+    # DirEntry cached die Stat-Infos (Windows) bzw. braucht nur einen Syscall (POSIX)
+    # Neue Chats: nur die .meta.json lesen; alte Chats: die .json selbst
+    prefix = f"{mode}_" if mode else ""
+    with os.scandir(chat_dir) as it:
+        entries = [
+            e for e in it
+            if e.name.endswith(".json") and e.name.startswith(prefix)
+        ]
+
+    # Sortiert nach Änderungsdatum (neueste zuerst)
+    entries.sort(key=lambda e: e.stat().st_mtime, reverse=True)
 
-    return chats
+    # Die Dateien sind unabhängig voneinander und das Lesen gibt den GIL frei,
+    # daher werden sie parallel gelesen (Reihenfolge bleibt erhalten)
+    with ThreadPoolExecutor(max_workers=_LIST_WORKERS) as executor:
+        for start in range(0, len(entries), _LIST_WORKERS):
+            batch = entries[start:start + _LIST_WORKERS]
+            for chat in executor.map(_extract_chat_meta, batch):
+                # Überspringe fehlerhafte/unvollständige Dateien (None)
+                if chat is not None:
+                    yield chat
 
 
 def show_chat_selection_menu(mode):
@@ -240,8 +681,12 @@ def show_chat_selection_menu(mode):
 
         Wähle einen Chat (0):
     """
+    from rich.prompt import Prompt
+
+    console = _get_console()
+
     # Hole alle gespeicherten Chats für diesen Modus
-    chats = list_saved_chats(mode)
+    chats = list_saved_chats(mode, limit=_MENU_LIMIT)
 
     # Falls keine Chats vorhanden sind
     if not chats:
@@ -251,51 +696,37 @@ def show_chat_selection_menu(mode):
     # Zeige Überschrift
     console.print(f"\n[bold cyan]Gespeicherte {mode}-Chats:[/bold cyan]\n")
 
-    # Zeige jeden Chat als nummerierte Option
-    for idx, chat in enumerate(chats, 1):  # Start bei 1 (nicht 0)
-        # Formatiere Timestamp für Anzeige: "2025:11:24 14:06:38"
-        # Format: YYYY-MM-DD_HH-MM-SS → YYYY:MM:DD HH:MM:SS
-        timestamp_parts = chat["timestamp"].split("_")  # Split date and time
-        if len(timestamp_parts) == 2:
-            date_part = timestamp_parts[0].replace("-", ":")  # 2025-11-24 → 2025:11:24
-            time_part = timestamp_parts[1].replace("-", ":")  # 14-06-38 → 14:06:38
-            timestamp_display = f"{date_part} {time_part}"
-        else:
-            # Fallback for unexpected format
-            timestamp_display = chat["timestamp"]
-
-        # Zeige: Nummer, Timestamp, Vorschau, Anzahl Nachrichten
-        console.print(
-            f"[cyan]{idx}[/cyan]. {timestamp_display} - {chat['preview']} "
-            f"[dim]({chat['message_count']} Nachrichten)[/dim]"
-        )
+    # Zeige jeden Chat als nummerierte Option (Start bei 1, nicht 0)
+    # Nummer, Timestamp, Vorschau, Anzahl Nachrichten — in einem einzigen print()
+    lines = [
+        f"[cyan]{idx}[/cyan]. {chat['timestamp_display']} - {chat['preview']} "
+        f"[dim]({chat['message_count']} Nachrichten)[/dim]"
+        for idx, chat in enumerate(chats, 1)
+    ]
+    console.print("\n".join(lines))
 
     # Option 0: Neuer Chat
     console.print(f"[cyan]0[/cyan]. Neuen Chat starten\n")
 
     # Eingabeschleife bis gültige Auswahl
+    # Ctrl+C im Auswahlmenü wird nicht abgefangen, globaler Handler übernimmt
     while True:
-        try:
-            choice = Prompt.ask("[bold cyan]Wähle einen Chat[/bold cyan]", default="0")
-
-            try:
-                choice_idx = int(choice)
+        choice = Prompt.ask("[bold cyan]Wähle einen Chat[/bold cyan]", default="0").strip()
 
-                # Option 0: Neuer Chat
-                if choice_idx == 0:
-                    return None
+        # User hat keine Zahl eingegeben
+        if not choice.removeprefix("-").isdecimal():
+            console.print("[red]Bitte gib eine Zahl ein.[/red]")
+            continue
 
-                # Gültige Chat-Nummer (1 bis Anzahl Chats)
-                if 1 <= choice_idx <= len(chats):
-                    return chats[choice_idx - 1]["filepath"]  # -1 weil Liste bei 0 startet
+        choice_idx = int(choice)
 
-                # Ungültige Nummer
-                console.print("[red]Ungültige Auswahl, bitte versuche es erneut.[/red]")
+        # Option 0: Neuer Chat
+        if choice_idx == 0:
+            return None
 
-            except ValueError:
-                # User hat keine Zahl eingegeben
-                console.print("[red]Bitte gib eine Zahl ein.[/red]")
+        # Gültige Chat-Nummer (1 bis Anzahl Chats)
+        if 1 <= choice_idx <= len(chats):
+            return chats[choice_idx - 1]["filepath"]  # -1 weil Liste bei 0 startet
 
-        except KeyboardInterrupt:
-            # Ctrl+C im Auswahlmenü → Gib None zurück, globaler Handler übernimmt
-            raise
+        # Ungültige Nummer
+        console.print("[red]Ungültige Auswahl, bitte versuche es erneut.[/red]")
@@ -7,25 +7,57 @@ Instruction-Files: ~/.config/KIterminal/instructions/*.txt
 Neues Format (v2.0) — pro Modus: provider + model + optionale Einstellungen.
 """
 
+import functools
 import json
 import os
+import pickle
 import sys
 from pathlib import Path
+from typing import Final
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # Optional: Fallback auf die Standard-Library
+    _loads = json.loads
 
 home_dir = Path.home()
 config_dir = home_dir / ".config" / "KIterminal"
 instructions_dir = config_dir / "instructions"
 
-config_dir.mkdir(parents=True, exist_ok=True)
+# Erstellt config_dir gleich mit (parents=True)
 instructions_dir.mkdir(parents=True, exist_ok=True)
 
 config_file = config_dir / "config.json"
 
+# Geparste Config (inkl. Instructions) über Prozessgrenzen hinweg
+config_cache_file = home_dir / ".cache" / "KIterminal" / "config.pkl"
+
+# Format des Cache-Inhalts — erhöhen, wenn sich Aufbau oder Migration der
+# Config ändern. Zusätzlich steht die Stat-Info des kit-Codes in der Signatur
+# (siehe _code_fingerprint), damit ein Update den Cache auch ohne Hochzählen verwirft.
+_CONFIG_CACHE_VERSION = 1
+
+
+LANGUAGE_PREFIXES = {
+    "en": "IMPORTANT: Always respond in English.\n\n",
+    "de": "IMPORTANT: Always respond in German.\n\n",
+    "chde": "IMPORTANT: Always respond in Swiss German.\n\n",
+    "fr": "IMPORTANT: Always respond in French.\n\n",
+    "es": "IMPORTANT: Always respond in Spanish.\n\n",
+    "it": "IMPORTANT: Always respond in Italian.\n\n",
+    "pt": "IMPORTANT: Always respond in Portuguese.\n\n",
+    "nl": "IMPORTANT: Always respond in Dutch.\n\n",
+}
+
 
 def load_instruction(filename: str, language: str = "en") -> str:
     """
     Lädt eine Instruction-Datei mit automatischem Sprach-Präfix.
 
+    Der Inhalt wird pro (Datei, Sprache, mtime) gecacht — nach einer
+    Bearbeitung der Datei wird sie automatisch neu gelesen.
+
     Args:
         filename: Name der Instruction-Datei (z.B. 'normalchat.txt')
         language: Antwort-Sprachcode ('en', 'de', 'chde', 'fr', …)
@@ -33,131 +65,129 @@ def load_instruction(filename: str, language: str = "en") -> str:
     Returns:
         Inhalt der Instruction-Datei mit Sprach-Präfix, oder Leerstring.
     """
-    instruction_file = instructions_dir / filename
-    if not instruction_file.exists():
+    try:
+        mtime_ns = os.stat(instructions_dir / filename).st_mtime_ns
+    except FileNotFoundError:
         return ""
-
-    base_instruction = instruction_file.read_text(encoding="utf-8")
-
-    language_prefixes = {
-        "en": "IMPORTANT: Always respond in English.\n\n",
-        "de": "IMPORTANT: Always respond in German.\n\n",
-        "chde": "IMPORTANT: Always respond in Swiss German.\n\n",
-        "fr": "IMPORTANT: Always respond in French.\n\n",
-        "es": "IMPORTANT: Always respond in Spanish.\n\n",
-        "it": "IMPORTANT: Always respond in Italian.\n\n",
-        "pt": "IMPORTANT: Always respond in Portuguese.\n\n",
-        "nl": "IMPORTANT: Always respond in Dutch.\n\n",
-    }
-
-    prefix = language_prefixes.get(language.lower(), "")
-    return prefix + base_instruction
+    return _load_instruction_cached(filename, language.lower(), mtime_ns)
+
+
+@functools.lru_cache(maxsize=64)
+def _load_instruction_cached(filename: str, language: str, mtime_ns: int) -> str:
+    """Liest eine Instruction-Datei und stellt das Sprach-Präfix voran."""
+    base_instruction = (instructions_dir / filename).read_text(encoding="utf-8")
+    return LANGUAGE_PREFIXES.get(language, "") + base_instruction
+
+
+# ── Default-Instructions ──────────────────────────────────────────────────
+
+_DEFAULT_INSTRUCTIONS: Final[dict[str, str]] = {
+    "normalchat.txt": """\
+Always respond in Markdown format.
+
+## Completeness & Persistence
+- Answer the question completely END-TO-END before stopping.
+- No unnecessary follow-up questions – make reasonable assumptions and document them at the end under 'Assumptions: …'.
+- When uncertain: mark briefly, but don't block.
+- Bias for action: If unclear → reasonable default assumption + justification.
+
+## Output Length & Structure
+- **Simple questions:** 2-4 sentences, no headings.
+- **Medium complexity:** 4-6 bullet points OR 6-8 sentences. Maximum 1 heading.
+- **Complex/multi-part questions:** Structured with **headings** (1-3 words, bold), bullet points allowed.
+- Bullet points only for steps/options/lists – not for everything.
+- No nested lists. No ANSI codes.
+
+## Tone & Style
+- **Efficiency shows respect:** Directly to the solution, no filler words.
+- Avoid: 'Sure!', 'Of course!', 'Got it!', 'Thanks for asking!' – start immediately with the answer.
+- Friendly but concise. No platitudes. Active voice.
+- Code/commands/paths in `backticks`. Never combine backticks with **.
+
+## Structure Guidelines
+- Headings: Optional, only when complexity justifies it. **Bold**, 1-3 words.
+- Bullet points: Use `-`. Combine related points. One line when possible.
+- Order: General → Specific → Supporting.
+- Code samples in fenced code blocks with language hint.
+
+## Conclusion
+- End with concrete result or next step (when appropriate).
+- No explicit confirmation questions like 'Does that work?' or 'Is that enough?'.
+""",
+    "codex.txt": """\
+You are Codex, a coding assistant. You are running as a coding agent in the KIterminal CLI on a user's computer.
+
+Always respond in Markdown format.
+
+## System Context
+- Operating System: {currentOS}
+- Platform: {platforminfo}
+
+## General
+- The arguments to `shell` will be passed to execvp(). Most terminal commands should be prefixed with ["bash", "-lc"].
+- Always set the `workdir` param when using the shell function. Do not use `cd` unless absolutely necessary.
+- When searching for text or files, prefer using `rg` or `rg --files` respectively because `rg` is much faster than alternatives like `grep`. (If the `rg` command is not found, then use alternatives.)
+
+## Editing constraints
+- Default to ASCII when editing or creating files. Only introduce non-ASCII or other Unicode characters when there is a clear justification and the file already uses them.
+- Add succinct code comments that explain what is going on if code is not self-explanatory.
+- You may be in a dirty git worktree.
+    * NEVER revert existing changes you did not make unless explicitly requested.
+    * If asked to make a commit or code edits and there are unrelated changes, don't revert those changes.
+    * If the changes are in files you've touched recently, read carefully and understand how you can work with the changes rather than reverting them.
+    * If the changes are in unrelated files, just ignore them and don't revert them.
+- While you are working, you might notice unexpected changes. If this happens, STOP IMMEDIATELY and ask the user how they would like to proceed.
+
+## Special user requests
+- If the user makes a simple request (such as asking for the time) which you can fulfill by running a terminal command (such as `date`), you should do so.
+- If the user asks for a "review", default to a code review mindset: prioritise identifying bugs, risks, behavioural regressions, and missing tests.
+
+## Presenting your work
+- Default: be very concise; friendly coding teammate tone.
+- Ask only when needed; suggest ideas; mirror the user's style.
+- For substantial work, summarize clearly.
+- Skip heavy formatting for simple confirmations.
+- Don't dump large files you've written; reference paths only.
+- Offer logical next steps (tests, commits, build) briefly.
+- For code changes: lead with a quick explanation, then more details on where and why.
+- When suggesting multiple options, use numeric lists so the user can quickly respond.
+
+### Final answer structure
+- Plain text; CLI handles styling. Use structure only when it helps scanability.
+- Headers: optional; short Title Case (1-3 words) wrapped in **…**.
+- Bullets: use - ; merge related points; keep to one line when possible.
+- Monospace: backticks for commands/paths/env vars/code ids.
+- Code samples in fenced code blocks; add a language hint whenever obvious.
+- Structure: group related bullets; order sections general → specific → supporting.
+- Tone: collaborative, concise, factual; present tense, active voice.
+- No nested bullets/hierarchies; no ANSI codes.
+- File References: use inline code to make file paths clickable; include line numbers.""",
+    "email.txt": """\
+Output ONLY the corrected email text — no comments, no explanations, no correction lists, no headings, no extra formatting. Just the improved text, nothing else.
+
+Improve only style, spelling, punctuation, and clarity. Keep the original voice and tone. Do not add or remove content.""",
+    "email_advanced.txt": """\
+Output ONLY the improved email text — no comments, no explanations, no correction lists, no headings, no extra formatting. Just the improved text, nothing else.
+
+Improve style, spelling, punctuation, clarity, and content. Strengthen weak phrasing, fix logical flow, remove redundancies, and sharpen the message. Keep the original intent, voice, and all facts. Do not add or remove relevant content.""",
+    "email_pro.txt": """\
+Output ONLY the rewritten email text — no comments, no explanations, no headings, no extra formatting. Just the improved text, nothing else.
+
+Rewrite the email in a professional business tone. Use formal but clear language, logical structure, and concise phrasing. Add a clear call to action where appropriate. Keep the original intent and all facts. Eliminate informal phrasing, typos, and weak formulations. The result should read as polished business communication.""",
+    "translate.txt": """\
+Always respond in Markdown format. Translate the text between German and English (auto-detect source language). Provide only the translated text, without explanations or additional content.""",
+}
 
 
 def save_default_instructions() -> None:
     """Erstellt Default-Instruction-Dateien, falls sie nicht existieren."""
-    defaults = {
-        "normalchat.txt": (
-            "Always respond in Markdown format.\n\n"
-            "## Completeness & Persistence\n"
-            "- Answer the question completely END-TO-END before stopping.\n"
-            "- No unnecessary follow-up questions – make reasonable assumptions and document them at the end under 'Assumptions: …'.\n"
-            "- When uncertain: mark briefly, but don't block.\n"
-            "- Bias for action: If unclear → reasonable default assumption + justification.\n\n"
-            "## Output Length & Structure\n"
-            "- **Simple questions:** 2-4 sentences, no headings.\n"
-            "- **Medium complexity:** 4-6 bullet points OR 6-8 sentences. Maximum 1 heading.\n"
-            "- **Complex/multi-part questions:** Structured with **headings** (1-3 words, bold), bullet points allowed.\n"
-            "- Bullet points only for steps/options/lists – not for everything.\n"
-            "- No nested lists. No ANSI codes.\n\n"
-            "## Tone & Style\n"
-            "- **Efficiency shows respect:** Directly to the solution, no filler words.\n"
-            "- Avoid: 'Sure!', 'Of course!', 'Got it!', 'Thanks for asking!' – start immediately with the answer.\n"
-            "- Friendly but concise. No platitudes. Active voice.\n"
-            "- Code/commands/paths in `backticks`. Never combine backticks with **.\n\n"
-            "## Structure Guidelines\n"
-            "- Headings: Optional, only when complexity justifies it. **Bold**, 1-3 words.\n"
-            "- Bullet points: Use `-`. Combine related points. One line when possible.\n"
-            "- Order: General → Specific → Supporting.\n"
-            "- Code samples in fenced code blocks with language hint.\n\n"
-            "## Conclusion\n"
-            "- End with concrete result or next step (when appropriate).\n"
-            "- No explicit confirmation questions like 'Does that work?' or 'Is that enough?'.\n"
-        ),
-        "codex.txt": (
-            "You are Codex, a coding assistant. You are running as a coding agent in the KIterminal CLI on a user's computer.\n\n"
-            "Always respond in Markdown format.\n\n"
-            "## System Context\n"
-            "- Operating System: {currentOS}\n"
-            "- Platform: {platforminfo}\n\n"
-            "## General\n"
-            "- The arguments to `shell` will be passed to execvp(). Most terminal commands should be prefixed with [\"bash\", \"-lc\"].\n"
-            "- Always set the `workdir` param when using the shell function. Do not use `cd` unless absolutely necessary.\n"
-            "- When searching for text or files, prefer using `rg` or `rg --files` respectively because `rg` is much faster than alternatives like `grep`. (If the `rg` command is not found, then use alternatives.)\n\n"
-            "## Editing constraints\n"
-            "- Default to ASCII when editing or creating files. Only introduce non-ASCII or other Unicode characters when there is a clear justification and the file already uses them.\n"
-            "- Add succinct code comments that explain what is going on if code is not self-explanatory.\n"
-            "- You may be in a dirty git worktree.\n"
-            "    * NEVER revert existing changes you did not make unless explicitly requested.\n"
-            "    * If asked to make a commit or code edits and there are unrelated changes, don't revert those changes.\n"
-            "    * If the changes are in files you've touched recently, read carefully and understand how you can work with the changes rather than reverting them.\n"
-            "    * If the changes are in unrelated files, just ignore them and don't revert them.\n"
-            "- While you are working, you might notice unexpected changes. If this happens, STOP IMMEDIATELY and ask the user how they would like to proceed.\n\n"
-            "## Special user requests\n"
-            "- If the user makes a simple request (such as asking for the time) which you can fulfill by running a terminal command (such as `date`), you should do so.\n"
-            "- If the user asks for a \"review\", default to a code review mindset: prioritise identifying bugs, risks, behavioural regressions, and missing tests.\n\n"
-            "## Presenting your work\n"
-            "- Default: be very concise; friendly coding teammate tone.\n"
-            "- Ask only when needed; suggest ideas; mirror the user's style.\n"
-            "- For substantial work, summarize clearly.\n"
-            "- Skip heavy formatting for simple confirmations.\n"
-            "- Don't dump large files you've written; reference paths only.\n"
-            "- Offer logical next steps (tests, commits, build) briefly.\n"
-            "- For code changes: lead with a quick explanation, then more details on where and why.\n"
-            "- When suggesting multiple options, use numeric lists so the user can quickly respond.\n\n"
-            "### Final answer structure\n"
-            "- Plain text; CLI handles styling. Use structure only when it helps scanability.\n"
-            "- Headers: optional; short Title Case (1-3 words) wrapped in **…**.\n"
-            "- Bullets: use - ; merge related points; keep to one line when possible.\n"
-            "- Monospace: backticks for commands/paths/env vars/code ids.\n"
-            "- Code samples in fenced code blocks; add a language hint whenever obvious.\n"
-            "- Structure: group related bullets; order sections general → specific → supporting.\n"
-            "- Tone: collaborative, concise, factual; present tense, active voice.\n"
-            "- No nested bullets/hierarchies; no ANSI codes.\n"
-            "- File References: use inline code to make file paths clickable; include line numbers."
-        ),
-        "email.txt": (
-            "Output ONLY the corrected email text — no comments, no explanations, "
-            "no correction lists, no headings, no extra formatting. Just the improved text, nothing else.\n\n"
-            "Improve only style, spelling, punctuation, and clarity. "
-            "Keep the original voice and tone. Do not add or remove content."
-        ),
-        "email_advanced.txt": (
-            "Output ONLY the improved email text — no comments, no explanations, "
-            "no correction lists, no headings, no extra formatting. Just the improved text, nothing else.\n\n"
-            "Improve style, spelling, punctuation, clarity, and content. "
-            "Strengthen weak phrasing, fix logical flow, remove redundancies, and sharpen the message. "
-            "Keep the original intent, voice, and all facts. Do not add or remove relevant content."
-        ),
-        "email_pro.txt": (
-            "Output ONLY the rewritten email text — no comments, no explanations, "
-            "no headings, no extra formatting. Just the improved text, nothing else.\n\n"
-            "Rewrite the email in a professional business tone. Use formal but clear language, "
-            "logical structure, and concise phrasing. Add a clear call to action where appropriate. "
-            "Keep the original intent and all facts. Eliminate informal phrasing, typos, and weak "
-            "formulations. The result should read as polished business communication."
-        ),
-        "translate.txt": (
-            "Always respond in Markdown format. "
-            "Translate the text between German and English (auto-detect source language). "
-            "Provide only the translated text, without explanations or additional content."
-        ),
-    }
+    # Ein scandir-Durchlauf statt exists() pro Datei
+    with os.scandir(instructions_dir) as it:
+        existing = {e.name for e in it}
 
-    for filename, content in defaults.items():
-        filepath = instructions_dir / filename
-        if not filepath.exists():
-            filepath.write_text(content, encoding="utf-8")
+    for filename, content in _DEFAULT_INSTRUCTIONS.items():
+        if filename not in existing:
+            (instructions_dir / filename).write_text(content, encoding="utf-8")
 
 
 # ── Default-Konfiguration (v2.0) ──────────────────────────────────────────
@@ -260,13 +290,85 @@ if not config_file.exists():
         json.dump(config_default, f, indent=4)
 
 
+@functools.lru_cache(maxsize=1)
+def _code_fingerprint() -> tuple | None:
+    """
+    Stat-Info des laufenden kit-Codes: config.py, bzw. bei der PyInstaller-Binary
+    die Binary selbst (dort liegen die Module im Archiv, nicht als Datei).
+    None, falls nicht prüfbar — dann zählt nur _CONFIG_CACHE_VERSION.
+    """
+    code_path = sys.executable if getattr(sys, "frozen", False) else __file__
+    try:
+        st = os.stat(code_path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _config_signature() -> tuple:
+    """
+    Stat-Signatur von config.json und allen Instruction-Dateien.
+
+    Ändert sich, sobald eine der Dateien bearbeitet, angelegt oder gelöscht wird,
+    und nach einem kit-Update (Cache-Version + Stat-Info des kit-Codes).
+    Ein einziger scandir-Durchlauf liefert die Stat-Infos aller Instructions.
+    """
+    with os.scandir(instructions_dir) as it:
+        instructions = tuple(sorted(
+            (e.name, e.stat().st_mtime_ns, e.stat().st_size) for e in it
+        ))
+    st = config_file.stat()
+    return (_CONFIG_CACHE_VERSION, _code_fingerprint(),
+            st.st_mtime_ns, st.st_size, instructions)
+
+
 def loadconfig() -> dict:
     """
     Lädt die Konfiguration aus config.json und Instructions aus Text-Dateien.
     Migriert automatisch von v1 → v2.
+
+    Das Ergebnis wird im Speicher und in ~/.cache/KIterminal/config.pkl
+    gehalten, solange sich keine der Dateien ändert — wiederholte Aufrufe
+    (auch aus neuen Prozessen) kosten nur noch die Stat-Signatur.
+    Das zurückgegebene Dict wird geteilt und darf nicht verändert werden.
     """
-    with open(config_file, "r") as f:
-        config = json.load(f)
+    return _loadconfig_cached(_config_signature())
+
+
+def _read_config_cache(signature: tuple) -> dict | None:
+    """Liest die gecachte Config, falls sie zur aktuellen Signatur passt."""
+    try:
+        with open(config_cache_file, "rb") as f:
+            cached = pickle.load(f)
+        if cached["signature"] == signature:
+            return cached["config"]
+    except Exception:
+        # Fehlender, veralteter oder kaputter Cache → einfach neu parsen
+        pass
+    return None
+
+
+def _write_config_cache(signature: tuple, config: dict) -> None:
+    """Schreibt die Config atomar in den Cache (Fehler werden ignoriert)."""
+    try:
+        config_cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = config_cache_file.with_name(config_cache_file.name + ".tmp")
+        with open(tmp_file, "wb") as f:
+            pickle.dump({"signature": signature, "config": config}, f)
+        os.replace(tmp_file, config_cache_file)
+    except OSError:
+        pass
+
+
+@functools.lru_cache(maxsize=1)
+def _loadconfig_cached(signature: tuple) -> dict:
+    """Parst config.json + Instructions; gecacht pro Stat-Signatur."""
+    config = _read_config_cache(signature)
+    if config is not None:
+        return config
+
+    with open(config_file, "rb") as f:
+        config = _loads(f.read())
 
     # Migration prüfen
     if config.get("version") != "2.0":
@@ -288,6 +390,7 @@ def loadconfig() -> dict:
     config["instructions"]["email_pro"] = load_instruction("email_pro.txt", language)
     config["instructions"]["translate"] = load_instruction("translate.txt", language)
 
+    _write_config_cache(signature, config)
     return config
 
 
@@ -7,38 +7,43 @@ Modi: chat, codex, mail (-m/-ma/-mp), translate (-t)
 Features: Streaming, Pipe-Support, Clipboard, Chat-History
 """
 
-import anthropic
 import sys
 import argparse
+import contextlib
+import functools
 import platform
+import shutil
 import subprocess
+import time
 import os
-from rich.console import Console
-from rich.markdown import Markdown
-from rich.live import Live
-from rich.prompt import Prompt
-from prompt_toolkit import prompt as pt_prompt
-from prompt_toolkit.formatted_text import HTML
-from prompt_toolkit.key_binding import KeyBindings
-import pyperclip
 
+# Schwere Abhängigkeiten (anthropic, rich, prompt_toolkit, pyperclip) werden
+# erst in den Funktionen importiert, die sie brauchen — so zahlen z.B.
+# `kit --help` oder `kit -e codex` nicht den ganzen Import-Graphen.
 from kit.config import loadconfig, init_config, get_mode_config
-from kit.chat_history import save_chat, load_chat, show_chat_selection_menu
-from kit import chat_history as ch
 from kit.providers import get_client, get_provider_name
 
 AUTHOR = "JLI-Software"
 VERSION = "0.9.1"
 LICENSE = "MIT"
-ANTHROPIC_VERSION = anthropic.__version__
 DESCRIPTION = "KIterminal — Schlankes KI-CLI-Tool. Multi-Provider: Anthropic + DeepSeek."
 
+# Bildwiederholrate beim Streaming; Markdown wird nicht oefter neu geparst
+LIVE_REFRESH_PER_SECOND = 10
+
+# Kurze Antworten ohne Markdown-Zeichen werden ohne Markdown-Parser angezeigt
+PLAIN_TEXT_MAX_LEN = 120
+MARKDOWN_CHARS = frozenset("`#*_[>")
+
+# Auto-Save im Hintergrund: spaetestens nach so vielen Runden bzw. Sekunden
+AUTOSAVE_EVERY_TURNS = 3
+AUTOSAVE_INTERVAL = 5.0
+# So lange wird beim Beenden hoechstens auf ausstehende Speicherungen gewartet
+SAVE_FLUSH_TIMEOUT = 10.0
+
 # ── CLI-Parser ────────────────────────────────────────────────────────────
 
-parser = argparse.ArgumentParser(
-    prog="kit",
-    description=DESCRIPTION,
-    epilog="""
+EPILOG = """
 Beispiele:
   kit                     Chat (default)
   kit -c                  Codex Programmier-Assistent
@@ -74,114 +79,156 @@ Umgebungsvariablen:
   DEEPSEEK_API_KEY        DeepSeek API-Key
 
 Mehr Infos: https://github.com/vikingjunior12/kit
-    """,
-    formatter_class=argparse.RawDescriptionHelpFormatter,
-)
-
-# ── Modi ──────────────────────────────────────────────────────────────────
-
-ai_modes = parser.add_argument_group("KI-Modi")
-ai_modes.add_argument(
-    "-c", "--codex",
-    nargs="?", const=True, metavar="TEXT",
-    help="Codex Programmier-Assistent (interaktiv oder One-Shot)",
-)
-
-# ── Textverarbeitung ──────────────────────────────────────────────────────
-
-text_proc = parser.add_argument_group("Textverarbeitung")
-text_proc.add_argument(
-    "-t", "--translate",
-    nargs="?", const=True, metavar="TEXT",
-    help="Uebersetzung DE<->EN (Clipboard oder Text)",
-)
-text_proc.add_argument(
-    "-m", "--mail",
-    nargs="?", const=True, metavar="TEXT",
-    help="E-Mail-Korrektur (Clipboard oder Text)",
-)
-text_proc.add_argument(
-    "-ma", "--mail-advanced",
-    nargs="?", const=True, metavar="TEXT",
-    help="E-Mail-Korrektur + inhaltliche Verbesserung",
-)
-text_proc.add_argument(
-    "-mp", "--mail-pro",
-    nargs="?", const=True, metavar="TEXT",
-    help="Professioneller E-Mail-Rewrite (Business-Ton)",
-)
-
-# ── Chat-Management ───────────────────────────────────────────────────────
-
-chat_mgmt = parser.add_argument_group("Chat-Management")
-chat_mgmt.add_argument(
-    "-r", "--resume",
-    action="store_true",
-    help="Vorherigen Chat fortsetzen",
-)
-
-# ── Konfiguration ─────────────────────────────────────────────────────────
-
-config_grp = parser.add_argument_group("Konfiguration")
-config_grp.add_argument(
-    "-s", "--setup", action="store_true",
-    help="Config-Datei mit Editor oeffnen",
-)
-config_grp.add_argument(
-    "-i", "--init", action="store_true",
-    help="Config auf Werkseinstellungen zuruecksetzen",
-)
-config_grp.add_argument(
-    "-e", "--edit-instructions", metavar="MODE",
-    help="Instructions fuer einen Modus bearbeiten "
-         "(normalchat, codex, email, email-advanced, email-pro, translate)",
-)
-
-# ── Info ──────────────────────────────────────────────────────────────────
-
-info_grp = parser.add_argument_group("Information")
-info_grp.add_argument(
-    "-v", "--version", action="store_true",
-    help="Version & Info anzeigen",
-)
-
-# Positionales Argument (fuer Piped-Input + Frage)
-parser.add_argument(
-    "question", nargs="?", default=None,
-    help="Frage (erforderlich bei Piped-Input)",
-)
-
-args = parser.parse_args()
+    """
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Erstellt den CLI-Parser (nur wenn wirklich geparst werden muss)."""
+    parser = argparse.ArgumentParser(
+        prog="kit",
+        description=DESCRIPTION,
+        epilog=EPILOG,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+
+    # ── Modi ──────────────────────────────────────────────────────────────
+
+    ai_modes = parser.add_argument_group("KI-Modi")
+    ai_modes.add_argument(
+        "-c", "--codex",
+        nargs="?", const=True, metavar="TEXT",
+        help="Codex Programmier-Assistent (interaktiv oder One-Shot)",
+    )
+
+    # ── Textverarbeitung ──────────────────────────────────────────────────
+
+    text_proc = parser.add_argument_group("Textverarbeitung")
+    text_proc.add_argument(
+        "-t", "--translate",
+        nargs="?", const=True, metavar="TEXT",
+        help="Uebersetzung DE<->EN (Clipboard oder Text)",
+    )
+    text_proc.add_argument(
+        "-m", "--mail",
+        nargs="?", const=True, metavar="TEXT",
+        help="E-Mail-Korrektur (Clipboard oder Text)",
+    )
+    text_proc.add_argument(
+        "-ma", "--mail-advanced",
+        nargs="?", const=True, metavar="TEXT",
+        help="E-Mail-Korrektur + inhaltliche Verbesserung",
+    )
+    text_proc.add_argument(
+        "-mp", "--mail-pro",
+        nargs="?", const=True, metavar="TEXT",
+        help="Professioneller E-Mail-Rewrite (Business-Ton)",
+    )
+
+    # ── Chat-Management ───────────────────────────────────────────────────
+
+    chat_mgmt = parser.add_argument_group("Chat-Management")
+    chat_mgmt.add_argument(
+        "-r", "--resume",
+        action="store_true",
+        help="Vorherigen Chat fortsetzen",
+    )
+
+    # ── Konfiguration ─────────────────────────────────────────────────────
+
+    config_grp = parser.add_argument_group("Konfiguration")
+    config_grp.add_argument(
+        "-s", "--setup", action="store_true",
+        help="Config-Datei mit Editor oeffnen",
+    )
+    config_grp.add_argument(
+        "-i", "--init", action="store_true",
+        help="Config auf Werkseinstellungen zuruecksetzen",
+    )
+    config_grp.add_argument(
+        "-e", "--edit-instructions", metavar="MODE",
+        help="Instructions fuer einen Modus bearbeiten "
+             "(normalchat, codex, email, email-advanced, email-pro, translate)",
+    )
+
+    # ── Info ──────────────────────────────────────────────────────────────
+
+    info_grp = parser.add_argument_group("Information")
+    info_grp.add_argument(
+        "-v", "--version", action="store_true",
+        help="Version & Info anzeigen",
+    )
+
+    # Positionales Argument (fuer Piped-Input + Frage)
+    parser.add_argument(
+        "question", nargs="?", default=None,
+        help="Frage (erforderlich bei Piped-Input)",
+    )
+
+    return parser
 
 
 # ── Umgebung ──────────────────────────────────────────────────────────────
 
-console = Console()
+_console = None
 currentOS = platform.system()
 platforminfo = platform.platform()
-config = loadconfig()
 
 # Chat-History (in-memory, global)
 chat_history: list[dict] = []
 
 
+def _get_console():
+    """Gibt die Rich-Console zurück und erstellt sie beim ersten Aufruf."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+
 # ── Prompt-Toolkit Setup ──────────────────────────────────────────────────
 
-kb = KeyBindings()
+_kb = None
+_session = None
+
+
+def _get_key_bindings():
+    """Key-Bindings für prompt_toolkit (Enter sendet ab), einmalig erstellt."""
+    global _kb
+    if _kb is None:
+        from prompt_toolkit.key_binding import KeyBindings
 
-@kb.add("enter")
-def _(event):
-    event.current_buffer.validate_and_handle()
+        _kb = KeyBindings()
+
+        @_kb.add("enter")
+        def _(event):
+            event.current_buffer.validate_and_handle()
+
+    return _kb
+
+
+def _get_session():
+    """PromptSession, einmalig erstellt und über alle Chat-Runden wiederverwendet."""
+    global _session
+    if _session is None:
+        from prompt_toolkit import PromptSession
+
+        _session = PromptSession(key_bindings=_get_key_bindings())
+    return _session
+
+
+@functools.lru_cache(maxsize=8)
+def _prompt_label(label: str):
+    """Geparstes HTML-Label für den Prompt (pro Label nur einmal geparst)."""
+    from prompt_toolkit.formatted_text import HTML
+
+    return HTML(f"<ansibrightcyan><b>{label} </b></ansibrightcyan>")
 
 
 def get_user_input(label: str = ">") -> str:
     """Benutzereingabe mit prompt_toolkit."""
     try:
-        return pt_prompt(
-            HTML(f"<ansibrightcyan><b>{label} </b></ansibrightcyan>"),
-            multiline=False,
-            key_bindings=kb,
-        ).strip()
+        return _get_session().prompt(_prompt_label(label), multiline=False).strip()
     except KeyboardInterrupt:
         raise
     except EOFError:
@@ -190,17 +237,21 @@ def get_user_input(label: str = ">") -> str:
 
 # ── Plattform-Helfer ─────────────────────────────────────────────────────
 
+# Umgebungs-Checks aendern sich waehrend der Laufzeit nicht → einmal pruefen
+
+@functools.lru_cache(maxsize=1)
 def is_termux() -> bool:
     return os.path.exists("/data/data/com.termux")
 
 
+@functools.lru_cache(maxsize=1)
 def is_wsl() -> bool:
     try:
         with open("/proc/version") as f:
             content = f.read().lower()
-            return "microsoft" in content or "wsl" in content
-    except Exception:
+    except OSError:
         return False
+    return "microsoft" in content or "wsl" in content
 
 
 def read_stdin() -> str | None:
@@ -224,15 +275,66 @@ def reopen_stdin_to_terminal() -> bool:
 
 # ── Clipboard ─────────────────────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=1)
+def _wsl_paste_cmd() -> list[str]:
+    """
+    Schnellster verfuegbarer Paste-Befehl unter WSL.
+    wl-paste (WSLg) startet in Millisekunden; PowerShell braucht ohne Profil
+    und ohne interaktiven Modus deutlich weniger Startzeit.
+    """
+    if os.environ.get("WAYLAND_DISPLAY") and shutil.which("wl-paste"):
+        return ["wl-paste", "--no-newline"]
+    return ["powershell.exe", "-NoProfile", "-NonInteractive", "-Command", "Get-Clipboard"]
+
+
+def _copy_termux(text: str) -> None:
+    subprocess.run(["termux-clipboard-set"], input=text.encode(), check=True)
+
+
+def _copy_wsl(text: str) -> None:
+    subprocess.run(["clip.exe"], input=text.encode(), check=True)
+
+
+def _paste_termux() -> str:
+    result = subprocess.run(
+        ["termux-clipboard-get"], capture_output=True, text=True, check=True
+    )
+    return result.stdout
+
+
+def _paste_wsl() -> str:
+    result = subprocess.run(
+        _wsl_paste_cmd(), capture_output=True, text=True, check=True,
+    )
+    return result.stdout.strip()
+
+
+# Clipboard-Funktionen der Plattform — beim ersten Zugriff einmal gewaehlt
+_copy_impl = None
+_paste_impl = None
+
+
+def _init_clipboard() -> None:
+    """Waehlt Copy/Paste passend zur Umgebung (Termux, WSL, sonst pyperclip)."""
+    global _copy_impl, _paste_impl
+    if is_termux():
+        _copy_impl, _paste_impl = _copy_termux, _paste_termux
+    elif is_wsl():
+        _copy_impl, _paste_impl = _copy_wsl, _paste_wsl
+    else:
+        import pyperclip
+
+        # pyperclip.copy/paste sind Platzhalter, die sich erst im Modul ersetzen —
+        # eine hier gemerkte Referenz wuerde bei jedem Aufruf neu erkennen
+        _copy_impl, _paste_impl = pyperclip.determine_clipboard()
+
+
 def copyline(text: str) -> None:
     """Text ins Clipboard kopieren (silent fail)."""
     try:
-        if is_termux():
-            subprocess.run(["termux-clipboard-set"], input=text.encode(), check=True)
-        elif is_wsl():
-            subprocess.run(["clip.exe"], input=text.encode(), check=True)
-        else:
-            pyperclip.copy(text)
+        if _copy_impl is None:
+            _init_clipboard()
+        _copy_impl(text)
     except Exception:
         pass
 
@@ -240,28 +342,34 @@ def copyline(text: str) -> None:
 def pasteline() -> str:
     """Text aus Clipboard lesen."""
     try:
-        if is_termux():
-            result = subprocess.run(
-                ["termux-clipboard-get"], capture_output=True, text=True, check=True
-            )
-            return result.stdout
-        elif is_wsl():
-            result = subprocess.run(
-                ["powershell.exe", "-command", "Get-Clipboard"],
-                capture_output=True, text=True, check=True,
-            )
-            return result.stdout.strip()
-        else:
-            return pyperclip.paste()
+        if _paste_impl is None:
+            _init_clipboard()
+        return _paste_impl()
     except Exception as e:
-        console.print(f"[red]✗ Clipboard-Fehler: {e}[/red]")
+        _get_console().print(f"[red]✗ Clipboard-Fehler: {e}[/red]")
         sys.exit(1)
 
 
 # ── API-Helfer ────────────────────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=1)
+def _api_errors() -> tuple[type[Exception], ...]:
+    """
+    API-Fehlerklassen fuer `except _api_errors()`.
+    Der Ausdruck wird erst ausgewertet, wenn wirklich eine Exception ankommt —
+    anthropic wird dafuer nicht vorab importiert.
+    """
+    import anthropic
+
+    return (anthropic.APIConnectionError, anthropic.AuthenticationError,
+            anthropic.RateLimitError, anthropic.APIStatusError)
+
+
 def handle_api_error(e: Exception) -> None:
     """Benutzerfreundliche Fehlermeldungen fuer API-Fehler."""
+    import anthropic
+
+    console = _get_console()
     if isinstance(e, anthropic.AuthenticationError):
         console.print("[red]✗ Ungueltiger API-Key![/red]")
         console.print("Pruefe ANTHROPIC_API_KEY / DEEPSEEK_API_KEY")
@@ -278,7 +386,7 @@ def handle_api_error(e: Exception) -> None:
 def get_response_text(response) -> str:
     """Extrahiert Text aus einer Anthropic-Response (nur non-streaming)."""
     if response.stop_reason == "refusal":
-        console.print("[yellow]! Anfrage abgelehnt[/yellow]")
+        _get_console().print("[yellow]! Anfrage abgelehnt[/yellow]")
         return ""
     text_blocks = [block.text for block in response.content if block.type == "text"]
     return "\n\n".join(text_blocks) if text_blocks else ""
@@ -301,12 +409,32 @@ def build_piped_message(question: str, stdin_content: str) -> str:
 
 # ── Chat-Funktionen ───────────────────────────────────────────────────────
 
+def _render(text: str):
+    """
+    Gibt ein Rich-Renderable fuer den Text zurueck.
+    Kurzer Text ohne Markdown-Zeichen braucht den Markdown-Parser nicht.
+    """
+    if len(text) < PLAIN_TEXT_MAX_LEN and MARKDOWN_CHARS.isdisjoint(text):
+        from rich.text import Text
+        return Text(text)
+    from rich.markdown import Markdown
+    return Markdown(text)
+
+
+def _thinking(msg: str):
+    """Spinner waehrend der Anfrage — nur im Terminal, nicht bei umgeleiteter Ausgabe."""
+    if sys.stdout.isatty():
+        return _get_console().status(msg)
+    return contextlib.nullcontext()
+
+
 def _call_api(mode: str, messages: list[dict], system: str, stream: bool = True) -> str:
     """
     Fuehrt einen API-Call fuer den angegebenen Modus aus.
     Bei stream=True wird die Antwort live mit Markdown-Rendering ausgegeben.
     """
-    mode_cfg = get_mode_config(config, mode)
+    console = _get_console()
+    mode_cfg = get_mode_config(loadconfig(), mode)
     provider = mode_cfg.get("provider", "anthropic")
     model = mode_cfg.get("model", "claude-sonnet-4-6")
     max_tokens = mode_cfg.get("max_tokens", 4096)
@@ -327,14 +455,27 @@ def _call_api(mode: str, messages: list[dict], system: str, stream: bool = True)
     )
 
     if stream:
+        from rich.live import Live
+
         full_text: list[str] = []
+        render_interval = 1 / LIVE_REFRESH_PER_SECOND
         try:
-            with Live(Markdown(""), console=console, refresh_per_second=10,
+            with Live(_render(""), console=console, refresh_per_second=LIVE_REFRESH_PER_SECOND,
                       vertical_overflow="visible") as live:
-                with client.messages.stream(**params) as s:
-                    for text in s.text_stream:
-                        full_text.append(text)
-                        live.update(Markdown("".join(full_text)))
+                last_render = 0.0
+                try:
+                    with client.messages.stream(**params) as s:
+                        for text in s.text_stream:
+                            full_text.append(text)
+                            # Den ganzen Text pro Chunk neu zu parsen waere O(n²) —
+                            # daher hoechstens so oft, wie Live ohnehin neu zeichnet
+                            now = time.monotonic()
+                            if now - last_render >= render_interval:
+                                live.update(_render("".join(full_text)))
+                                last_render = now
+                finally:
+                    # Letzten Stand immer rendern (auch bei Ctrl+C)
+                    live.update(_render("".join(full_text)))
         except KeyboardInterrupt:
             # Sauberer Abbruch – Live-Display wird automatisch geschlossen,
             # teilweise gestreamter Text wird trotzdem gespeichert
@@ -343,66 +484,66 @@ def _call_api(mode: str, messages: list[dict], system: str, stream: bool = True)
             raise
         return "".join(full_text)
     else:
-        with console.status(f"[bold green]{get_provider_name(provider)}/{model} …[/bold green]"):
+        with _thinking(f"[bold green]{get_provider_name(provider)}/{model} …[/bold green]"):
             response = client.messages.create(**params)
         return get_response_text(response)
 
 
-def normalchat(userfrage: str) -> None:
-    """Normaler Chat-Modus (interaktiv)."""
+def _chat_turn(mode: str, userfrage: str, system: str) -> None:
+    """Eine Runde im interaktiven Chat: Frage anhaengen, streamen, Antwort merken."""
     chat_history.append({"role": "user", "content": userfrage})
     try:
-        response_text = _call_api(
-            "normalchat",
-            messages=chat_history,
-            system=config["instructions"]["normalchat"],
-        )
+        response_text = _call_api(mode, messages=chat_history, system=system)
         chat_history.append({"role": "assistant", "content": response_text})
         copyline(response_text)
-    except (anthropic.APIConnectionError, anthropic.AuthenticationError,
-            anthropic.RateLimitError, anthropic.APIStatusError) as e:
+    except _api_errors() as e:
         handle_api_error(e)
         chat_history.pop()
 
 
-def codex(userfrage: str) -> None:
-    """Codex Programmier-Assistent (interaktiv)."""
-    instruction = config["instructions"]["codex"].format(
-        currentOS=currentOS, platforminfo=platforminfo
-    )
-    chat_history.append({"role": "user", "content": userfrage})
+def _one_shot(mode: str, content: str) -> None:
+    """Einzelne Anfrage ohne Historie; die Antwort geht ins Clipboard und nach stdout."""
     try:
         response_text = _call_api(
-            "codex",
-            messages=chat_history,
-            system=instruction,
+            mode,
+            messages=[{"role": "user", "content": content}],
+            system=loadconfig()["instructions"][mode],
+            stream=False,
         )
-        chat_history.append({"role": "assistant", "content": response_text})
         copyline(response_text)
-    except (anthropic.APIConnectionError, anthropic.AuthenticationError,
-            anthropic.RateLimitError, anthropic.APIStatusError) as e:
+        print(response_text)
+    except _api_errors() as e:
         handle_api_error(e)
-        chat_history.pop()
+
+
+def normalchat(userfrage: str) -> None:
+    """Normaler Chat-Modus (interaktiv)."""
+    _chat_turn("normalchat", userfrage, loadconfig()["instructions"]["normalchat"])
+
+
+@functools.lru_cache(maxsize=1)
+def _codex_instruction(template: str) -> str:
+    """
+    Codex-Instruction mit eingesetzten Plattform-Infos.
+    Gecacht ueber das Template: aendert sich die Instruction-Datei, liefert
+    loadconfig() ein neues Template und der Cache greift nicht mehr.
+    """
+    return template.format(currentOS=currentOS, platforminfo=platforminfo)
+
+
+def codex(userfrage: str) -> None:
+    """Codex Programmier-Assistent (interaktiv)."""
+    _chat_turn("codex", userfrage, _codex_instruction(loadconfig()["instructions"]["codex"]))
 
 
 def mail_correct(userfrage: str, mode: str = "email") -> None:
     """E-Mail-Korrektur (One-Shot)."""
-    try:
-        response_text = _call_api(
-            mode,
-            messages=[{"role": "user", "content": f"Proofread this email:\n\n{userfrage}"}],
-            system=config["instructions"][mode],
-            stream=False,
-        )
-        copyline(response_text)
-        print(response_text)
-    except (anthropic.APIConnectionError, anthropic.AuthenticationError,
-            anthropic.RateLimitError, anthropic.APIStatusError) as e:
-        handle_api_error(e)
+    _one_shot(mode, f"Proofread this email:\n\n{userfrage}")
 
 
 def _run_mail(mode: str, args_flag, stdin_content: str | None, question: str | None) -> None:
     """Gemeinsame Routing-Logik fuer alle Mail-Modi (-m, -ma, -mp)."""
+    console = _get_console()
     if isinstance(args_flag, str):
         mail_correct(args_flag, mode=mode)
     elif stdin_content:
@@ -417,18 +558,7 @@ def _run_mail(mode: str, args_flag, stdin_content: str | None, question: str | N
 
 def translate(userfrage: str) -> None:
     """Uebersetzung DE<->EN (One-Shot)."""
-    try:
-        response_text = _call_api(
-            "translate",
-            messages=[{"role": "user", "content": f"Translate:\n\n{userfrage}"}],
-            system=config["instructions"]["translate"],
-            stream=False,
-        )
-        copyline(response_text)
-        print(response_text)
-    except (anthropic.APIConnectionError, anthropic.AuthenticationError,
-            anthropic.RateLimitError, anthropic.APIStatusError) as e:
-        handle_api_error(e)
+    _one_shot("translate", f"Translate:\n\n{userfrage}")
 
 
 # ── Interaktiver Chat-Loop ────────────────────────────────────────────────
@@ -439,20 +569,23 @@ def interactive_chat(turn_handler, mode: str = None, resume_chat: bool = False,
     Interaktiver Chat mit Resume- und Auto-Save-Funktionalitaet.
     """
     global chat_history
+    from kit import chat_history as ch
+
+    console = _get_console()
 
     # ── Mode-Konfig einmal laden ───────────────────────────────────────
-    mode_cfg = get_mode_config(config, mode) if mode else {}
+    mode_cfg = get_mode_config(loadconfig(), mode) if mode else {}
     provider_name = mode_cfg.get("provider", "?")
     model_name = mode_cfg.get("model", "?")
     model_short = model_name.replace("claude-", "").replace("deepseek-", "")
     prompt_label = f"{provider_name[:4]}/{model_short} >" if mode else ">"
 
     if resume_chat and mode:
-        selected = show_chat_selection_menu(mode)
+        selected = ch.show_chat_selection_menu(mode)
         if selected:
             try:
                 chat_history.clear()
-                loaded = load_chat(selected)
+                loaded = ch.load_chat(selected)
                 chat_history.extend(loaded)
                 ch.current_chat_file = selected
                 console.print(f"[green]Chat geladen ({len(chat_history)} Nachrichten)[/green]")
@@ -475,17 +608,33 @@ def interactive_chat(turn_handler, mode: str = None, resume_chat: bool = False,
             f"[dim]kit v{VERSION}  ·  {provider_display}  ·  {model_name}  ·  {mode_display}[/dim]"
         )
 
+    # ── Auto-Save (entprellt, im Hintergrund) ──────────────────────────
+    turns_since_save = 0
+    last_save = time.monotonic()
+
+    def run_turn(userfrage: str) -> None:
+        nonlocal turns_since_save, last_save
+        turn_handler(userfrage)
+        if not (mode and chat_history):
+            return
+        turns_since_save += 1
+        now = time.monotonic()
+        if turns_since_save >= AUTOSAVE_EVERY_TURNS or now - last_save >= AUTOSAVE_INTERVAL:
+            ch.save_chat_async(chat_history, mode)
+            turns_since_save = 0
+            last_save = now
+
     try:
         if initial_message:
             if not sys.stdin.isatty():
                 console.print("[dim]Piped-Input wird verarbeitet ...[/dim]")
-                turn_handler(initial_message)
+                run_turn(initial_message)
                 if not reopen_stdin_to_terminal():
                     console.print("[dim]Tipp: Mit -r kannst du diesen Chat spaeter fortsetzen[/dim]")
                     return
                 console.print(f"[dim]Interaktiver Modus  —  {prompt_label}[/dim]")
             else:
-                turn_handler(initial_message)
+                run_turn(initial_message)
 
         while True:
             userfrage = get_user_input(prompt_label)
@@ -493,34 +642,50 @@ def interactive_chat(turn_handler, mode: str = None, resume_chat: bool = False,
                 continue
             if userfrage.lower() == "exit":
                 break
-            turn_handler(userfrage)
+            run_turn(userfrage)
 
     except KeyboardInterrupt:
         console.print()
-        if mode and chat_history:
-            save_chat(chat_history, mode, filepath=ch.current_chat_file)
         raise
     finally:
+        # Letzter Stand wird immer gespeichert (auch bei Ctrl+C)
         if mode and chat_history:
-            save_chat(chat_history, mode, filepath=ch.current_chat_file)
-            console.print("[dim]Chat gespeichert[/dim]")
+            ch.save_chat_async(chat_history, mode)
+            if ch.flush_saves(SAVE_FLUSH_TIMEOUT):
+                console.print("[dim]Chat gespeichert[/dim]")
+            else:
+                console.print("[yellow]! Speichern dauert zu lange – Chat evtl. unvollstaendig[/yellow]")
         ch.current_chat_file = None
 
 
 # ── Config-Editor ─────────────────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=1)
+def _nvim_path() -> str | None:
+    """Pfad zu nvim oder None (PATH-Suche ohne `which`-Subprozess)."""
+    return shutil.which("nvim")
+
+
 def _open_with_editor(filepath: str, success_msg: str) -> None:
     """Oeffnet eine Datei mit dem System-Editor."""
+    console = _get_console()
     try:
         if currentOS == "Windows":
             os.startfile(filepath)
         elif currentOS == "Darwin":
             subprocess.run(["open", filepath])
         else:
-            if subprocess.run(["which", "nvim"], capture_output=True).returncode == 0:
-                subprocess.run(["nvim", filepath])
-            else:
-                subprocess.run(["xdg-open", filepath])
+            # Nach dem Editor passiert nichts mehr → Prozess direkt ersetzen
+            # (kein Fork, Python-Heap ist weg, bevor der Editor startet).
+            # Pfad vorher aufloesen: Meldung nur, wenn es den Editor gibt —
+            # execv kehrt danach nicht zurueck.
+            editor = _nvim_path() or shutil.which("xdg-open")
+            if editor is None:
+                console.print("[red]✗ Kein Editor gefunden (nvim oder xdg-open)[/red]")
+                return
+            console.print(f"[green]{success_msg}[/green]")
+            sys.stdout.flush()
+            os.execv(editor, [editor, filepath])
         console.print(f"[green]{success_msg}[/green]")
     except Exception as e:
         console.print(f"[red]✗ Fehler beim Oeffnen: {e}[/red]")
@@ -540,6 +705,7 @@ def edit_instructions(mode: str) -> None:
         "email": "email.txt", "email-advanced": "email_advanced.txt",
         "email-pro": "email_pro.txt", "translate": "translate.txt",
     }
+    console = _get_console()
     if mode.lower() not in mode_files:
         console.print(f"[red]✗ Unbekannter Modus: {mode}[/red]")
         console.print(f"[yellow]Verfuegbar: {', '.join(sorted(mode_files.keys()))}[/yellow]")
@@ -553,7 +719,32 @@ def edit_instructions(mode: str) -> None:
 
 # ── Main ──────────────────────────────────────────────────────────────────
 
+def show_version() -> None:
+    """Zeigt Version & Info an."""
+    from importlib import metadata
+
+    # Version aus den Paket-Metadaten — ohne das SDK selbst zu importieren
+    try:
+        sdk_version = metadata.version("anthropic")
+    except metadata.PackageNotFoundError:
+        sdk_version = "nicht installiert"
+
+    console = _get_console()
+    console.print(f"[bold cyan]Version:[/bold cyan]       [green]{VERSION}[/green]")
+    console.print(f"[bold cyan]Autor:[/bold cyan]        [yellow]{AUTHOR}[/yellow]")
+    console.print(f"[bold cyan]Lizenz:[/bold cyan]        [blue]{LICENSE}[/blue]")
+    console.print(f"[bold cyan]SDK:[/bold cyan]           [magenta]anthropic {sdk_version}[/magenta]")
+    console.print(f"[bold cyan]Beschreibung:[/bold cyan]  [magenta]{DESCRIPTION}[/magenta]")
+
+
 def main() -> None:
+    # Schnellpfad: `kit -v` braucht weder Parser noch stdin
+    if len(sys.argv) == 2 and sys.argv[1] in ("-v", "--version"):
+        show_version()
+        return
+
+    args = _build_parser().parse_args()
+    console = _get_console()
     stdin_content = read_stdin()
 
     # Frage ermitteln (positional > mode-argument)
@@ -593,11 +784,7 @@ def main() -> None:
         show_setup_file()
 
     elif args.version:
-        console.print(f"[bold cyan]Version:[/bold cyan]       [green]{VERSION}[/green]")
-        console.print(f"[bold cyan]Autor:[/bold cyan]        [yellow]{AUTHOR}[/yellow]")
-        console.print(f"[bold cyan]Lizenz:[/bold cyan]        [blue]{LICENSE}[/blue]")
-        console.print(f"[bold cyan]SDK:[/bold cyan]           [magenta]anthropic {ANTHROPIC_VERSION}[/magenta]")
-        console.print(f"[bold cyan]Beschreibung:[/bold cyan]  [magenta]{DESCRIPTION}[/magenta]")
+        show_version()
 
     elif args.mail:
         _run_mail("email", args.mail, stdin_content, question)
@@ -637,5 +824,5 @@ if __name__ == "__main__":
     try:
         main()
     except KeyboardInterrupt:
-        console.print("\n[yellow]Beendet[/yellow]")
+        _get_console().print("\n[yellow]Beendet[/yellow]")
         os._exit(0)
@@ -5,8 +5,12 @@ Unterstützt Anthropic (nativ) und DeepSeek (via Anthropic-kompatiblem Endpoint)
 DeepSeek: https://api-docs.deepseek.com/guides/anthropic_api
 """
 
+import atexit
 import os
-import anthropic
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import anthropic
 
 # Provider-Konfiguration
 PROVIDERS = {
@@ -22,10 +26,27 @@ PROVIDERS = {
     },
 }
 
+# Ein Client pro (Provider, API-Key): der httpx-Pool des SDK hält die
+# TLS-Verbindung über mehrere Chat-Runden offen (Keep-Alive)
+_clients: dict[tuple[str, str], "anthropic.Anthropic"] = {}
+
+
+def _close_clients() -> None:
+    """Schliesst alle gecachten Clients beim Beenden."""
+    for client in _clients.values():
+        client.close()
+    _clients.clear()
+
+
+atexit.register(_close_clients)
 
-def get_client(provider_name: str) -> anthropic.Anthropic:
+
+def get_client(provider_name: str) -> "anthropic.Anthropic":
     """
-    Erstellt einen Anthropic-Client für den angegebenen Provider.
+    Gibt den Anthropic-Client für den angegebenen Provider zurück.
+
+    Der Client wird pro Provider und API-Key nur einmal erstellt und danach
+    wiederverwendet, damit Folgeanfragen die offene Verbindung nutzen.
 
     Args:
         provider_name: "anthropic" oder "deepseek"
@@ -51,11 +72,18 @@ def get_client(provider_name: str) -> anthropic.Anthropic:
             f"Bitte setze die Umgebungsvariable: export {cfg['env']}='dein-key'"
         )
 
+    client = _clients.get((provider_name, api_key))
+    if client is not None:
+        return client
+
+    import anthropic  # Lazy: das SDK ist der teuerste Import von kit
+
     kwargs = {"api_key": api_key}
     if cfg["base_url"]:
         kwargs["base_url"] = cfg["base_url"]
 
-    return anthropic.Anthropic(**kwargs)
+    client = _clients[(provider_name, api_key)] = anthropic.Anthropic(**kwargs)
+    return client
 
 
 def get_provider_name(provider_name: str) -> str: